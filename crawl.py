@@ -11,6 +11,104 @@ import json
 from datetime import datetime
 import time
 import os
+import re
+
+# 설명 분석 시 카운트할 키워드 (대소문자 구분)
+COMMON_WORDS = ['Environment', 'environment', 'Carbon', 'carbon', 'social', 'Social', 'Diversity', 'diversity']
+
+# YouTube contentDetails.duration 형식 (예: PT1H2M3S, P1DT2H, P0D)
+ISO8601_DURATION_PATTERN = re.compile(
+    r'^P(?:(\d+)W)?(?:(\d+)D)?(?:T(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?)?$'
+)
+
+def parse_iso8601_duration(duration):
+    """ISO 8601 기간 문자열을 초 단위 정수로 변환 (형식이 다르면 0)"""
+    match = ISO8601_DURATION_PATTERN.match(duration or '')
+    if not match:
+        return 0
+    weeks, days, hours, minutes, seconds = (int(value) if value else 0 for value in match.groups())
+    return (((weeks * 7 + days) * 24 + hours) * 60 + minutes) * 60 + seconds
+
+class CrawlStats:
+    """수집 통계를 영상 하나씩 받아 바로 갱신하는 누적기 (DataFrame 없이 한 번만 훑음)"""
+    def __init__(self, keywords=COMMON_WORDS):
+        self.keywords = list(keywords)
+        self.count = 0
+        self.total_views = 0
+        self.total_likes = 0
+        self.total_duration_seconds = 0
+        self.total_description_length = 0
+        self.max_description_length = 0
+        self.empty_descriptions = 0
+        self.earliest_published_at = None
+        self.latest_published_at = None
+        self.keyword_hits = {word: 0 for word in self.keywords}
+
+    def update(self, video_detail):
+        """영상 상세정보 하나 반영"""
+        description = video_detail.get('description') or ''
+        description_length = len(description)
+
+        self.count += 1
+        self.total_views += video_detail.get('view_count', 0)
+        self.total_likes += video_detail.get('like_count', 0)
+        self.total_duration_seconds += video_detail.get('duration_seconds', 0)
+        self.total_description_length += description_length
+        self.max_description_length = max(self.max_description_length, description_length)
+        if description_length == 0:
+            self.empty_descriptions += 1
+
+        # ISO 8601 UTC 문자열이라 문자열 비교로 날짜 비교 가능
+        published_at = video_detail.get('published_at')
+        if published_at:
+            if self.earliest_published_at is None or published_at < self.earliest_published_at:
+                self.earliest_published_at = published_at
+            if self.latest_published_at is None or published_at > self.latest_published_at:
+                self.latest_published_at = published_at
+
+        for word in self.keywords:
+            self.keyword_hits[word] += description.count(word)
+
+    @classmethod
+    def from_videos(cls, videos_data):
+        """이미 수집된 영상 목록으로 통계 생성"""
+        stats = cls()
+        for video_detail in videos_data:
+            stats.update(video_detail)
+        return stats
+
+    def _mean(self, total):
+        return total / self.count if self.count else 0
+
+    @property
+    def mean_views(self):
+        return self._mean(self.total_views)
+
+    @property
+    def mean_likes(self):
+        return self._mean(self.total_likes)
+
+    @property
+    def mean_duration_seconds(self):
+        return self._mean(self.total_duration_seconds)
+
+    @property
+    def mean_description_length(self):
+        return self._mean(self.total_description_length)
+
+    @staticmethod
+    def _format_date(published_at):
+        if not published_at:
+            return '-'
+        return pd.to_datetime(published_at).strftime('%Y-%m-%d %H:%M:%S')
+
+    @property
+    def earliest_date(self):
+        return self._format_date(self.earliest_published_at)
+
+    @property
+    def latest_date(self):
+        return self._format_date(self.latest_published_at)
 
 class NikeYouTubeScraper:
     def __init__(self, api_key):
@@ -18,6 +116,8 @@ class NikeYouTubeScraper:
         self.base_url = 'https://www.googleapis.com/youtube/v3'
         self.nike_channel_handle = '@nike'  # 나이키 채널 핸들
         self.nike_channel_id = None  # 나중에 자동으로 찾을 예정
+        self.stats = CrawlStats()  # get_video_details에서 영상마다 갱신
+        self._stats_source = None  # self.stats가 집계한 영상 목록
         
     def get_channel_id_by_handle(self, handle):
         """채널 핸들(@nike)로 채널 ID 찾기"""
@@ -225,6 +325,8 @@ class NikeYouTubeScraper:
     def get_video_details(self, video_ids):
         """영상 상세 정보 (설명 포함) 가져오기"""
         videos_details = []
+        self.stats = CrawlStats()
+        self._stats_source = videos_details
         
         # None이나 빈 ID 제거
         valid_video_ids = [vid for vid in video_ids if vid and isinstance(vid, str)]
@@ -241,7 +343,7 @@ class NikeYouTubeScraper:
             
             videos_url = f"{self.base_url}/videos"
             params = {
-                'part': 'snippet,statistics',
+                'part': 'snippet,statistics,contentDetails',  # 같은 요청에서 영상 길이도 함께
                 'id': ids_string,
                 'key': self.api_key
             }
@@ -255,6 +357,7 @@ class NikeYouTubeScraper:
                     try:
                         snippet = item['snippet']
                         stats = item.get('statistics', {})
+                        content_details = item.get('contentDetails', {})
                         
                         video_detail = {
                             'video_id': item['id'],
@@ -266,10 +369,11 @@ class NikeYouTubeScraper:
                             'view_count': int(stats.get('viewCount', 0)),
                             'like_count': int(stats.get('likeCount', 0)),
                             'comment_count': int(stats.get('commentCount', 0)),
-                            'duration_seconds': 0,  # 필요시 추가 가능
+                            'duration_seconds': parse_iso8601_duration(content_details.get('duration')),
                             'video_url': f"https://www.youtube.com/watch?v={item['id']}"
                         }
                         videos_details.append(video_detail)
+                        self.stats.update(video_detail)
                         
                     except Exception as e:
                         print(f"⚠️  영상 상세정보 처리 중 오류: {e}")
@@ -323,6 +427,12 @@ class NikeYouTubeScraper:
         
         return detailed_videos
     
+    def get_stats(self, videos_data):
+        """수집 중 누적된 통계 반환 (get_video_details가 만든 목록이 아니면 한 번 훑어서 새로 계산)"""
+        if videos_data is self._stats_source and self.stats.count == len(videos_data):
+            return self.stats
+        return CrawlStats.from_videos(videos_data)
+    
     def save_to_csv(self, videos_data, filename=None):
         """데이터를 CSV 파일로 저장"""
         if not videos_data:
@@ -343,7 +453,7 @@ class NikeYouTubeScraper:
         # 컬럼 순서 정리
         columns_order = [
             'video_id', 'title', 'description', 'published_date', 'published_at',
-            'channel_title', 'tags', 'view_count', 'like_count', 'comment_count', 'video_url'
+            'channel_title', 'tags', 'view_count', 'like_count', 'comment_count', 'duration_seconds', 'video_url'
         ]
         df = df[columns_order]
         
@@ -354,12 +464,14 @@ class NikeYouTubeScraper:
             print(f"📊 총 {len(df)}개 영상 데이터 저장됨")
             
             # 간단한 통계 출력
+            stats = self.get_stats(videos_data)
             print(f"\n📈 수집 통계:")
-            print(f"   - 평균 조회수: {df['view_count'].mean():,.0f}회")
-            print(f"   - 평균 좋아요: {df['like_count'].mean():,.0f}개")
-            print(f"   - 평균 설명 길이: {df['description'].str.len().mean():.0f}자")
-            print(f"   - 최신 영상: {df['published_date'].max()}")
-            print(f"   - 가장 오래된 영상: {df['published_date'].min()}")
+            print(f"   - 평균 조회수: {stats.mean_views:,.0f}회")
+            print(f"   - 평균 좋아요: {stats.mean_likes:,.0f}개")
+            print(f"   - 평균 영상 길이: {stats.mean_duration_seconds:.0f}초")
+            print(f"   - 평균 설명 길이: {stats.mean_description_length:.0f}자")
+            print(f"   - 최신 영상: {stats.latest_date}")
+            print(f"   - 가장 오래된 영상: {stats.earliest_date}")
             
             return filename
             
@@ -372,22 +484,18 @@ class NikeYouTubeScraper:
         if not videos_data:
             return
         
-        df = pd.DataFrame(videos_data)
+        stats = self.get_stats(videos_data)
         
         print(f"\n🔍 영상 설명 분석:")
-        print(f"   - 총 영상 수: {len(df)}개")
-        print(f"   - 설명이 있는 영상: {len(df[df['description'].str.len() > 0])}개")
-        print(f"   - 빈 설명: {len(df[df['description'].str.len() == 0])}개")
-        print(f"   - 평균 설명 길이: {df['description'].str.len().mean():.0f}자")
-        print(f"   - 최장 설명 길이: {df['description'].str.len().max()}자")
+        print(f"   - 총 영상 수: {stats.count}개")
+        print(f"   - 설명이 있는 영상: {stats.count - stats.empty_descriptions}개")
+        print(f"   - 빈 설명: {stats.empty_descriptions}개")
+        print(f"   - 평균 설명 길이: {stats.mean_description_length:.0f}자")
+        print(f"   - 최장 설명 길이: {stats.max_description_length}자")
         
         # 자주 나오는 키워드 (간단 분석)
-        all_descriptions = ' '.join(df['description'].fillna('').astype(str))
-        common_words = ['Environment', 'environment', 'Carbon', 'carbon', 'social', 'Social', 'Diversity', 'diversity']
-        
         print(f"\n🏷️  주요 키워드 출현 빈도:")
-        for word in common_words:
-            count = all_descriptions.count(word)
+        for word, count in stats.keyword_hits.items():
             if count > 0:
                 print(f"   - '{word}': {count}회")
 
@@ -528,6 +636,6 @@ def test_api_only():
 
 결과:
 - nike_youtube_descriptions_YYYYMMDD_HHMMSS.csv 파일 생성
-- 영상 ID, 제목, 설명, 발행일, 조회수, 좋아요 수 등 포함
+- 영상 ID, 제목, 설명, 발행일, 조회수, 좋아요 수, 영상 길이(초) 등 포함
 - 한글 설명도 완벽 지원 (UTF-8)
 """
\ No newline at end of file
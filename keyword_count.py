@@ -1,6 +1,9 @@
 import pandas as pd
 import re
+import os
+import json
 from collections import Counter
+from functools import lru_cache
 
 # CSV 파일 읽기
 df = pd.read_csv('nike_youtube_descriptions.csv')
@@ -48,33 +51,143 @@ print("🔍 방법 3: 복수형/변형 포함 매칭")
 print("="*50)
 
 # 키워드와 그 변형들을 그룹으로 정의
+# 정규화(소문자 + 어간 추출) 후 비교하므로 복수형/시제/부사형과 일부 파생형
+# (-mental, -ability, -ity)은 대표 형태만 적어도 함께 매칭됨
+# (예: 'environment' -> 'environments', 'environmental', 'environmentally')
+# 어간이 다른 변형은 정규화로 합쳐지지 않으므로 반드시 따로 적어야 함:
+#   'society'(≠ social), 'inclusion'/'inclusive'(서로 다름), 'sustain'(≠ sustainable)
 keyword_groups = {
-    'environment': ['environment', 'environmental', 'environments'],
-    'carbon': ['carbon', 'carbons', 'carbon-neutral', 'carbon-free'],
-    'social': ['social', 'socially', 'society'],
-    'diversity': ['diversity', 'diverse', 'inclusion', 'inclusive'],
-    'sustainability': ['sustainability', 'sustainable', 'sustain'],
+    'environment': ['environment'],
+    'carbon': ['carbon', 'carbon-neutral', 'carbon-free'],
+    'social': ['social', 'society'],
+    'diversity': ['diversity', 'inclusion', 'inclusive'],
+    'sustainability': ['sustainability', 'sustain'],
     'green': ['green', 'eco-friendly', 'eco'],
-    'climate': ['climate', 'global warming', 'warming']
+    # 'warming' 단독은 어간이 'warm'이 되어 'warm-up' 등과 섞이므로 구(phrase)로만 매칭
+    'climate': ['climate', 'global warming']
 }
 
-def count_keyword_group(text, word_list):
-    """키워드 그룹의 모든 변형을 카운팅"""
-    total_count = 0
-    details = {}
-    for word in word_list:
-        count = count_word_exact(text, word)
-        if count > 0:
-            details[word] = count
-        total_count += count
-    return total_count, details
+# 토큰화/정규화/매칭 규칙을 바꾸면 올릴 것 (저장된 트렌드 롤업을 새로 만들게 됨)
+GROUP_MATCHER_VERSION = 2
+
+# 토큰: 영숫자 단어 + 하이픈 복합어 (carbon-neutral, eco-friendly)
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+(?:-[a-z0-9]+)*")
+
+# 접미사 치환 규칙 ((접미사, 치환 문자열), 위에서부터 먼저 검사, 단계별로 최대 한 번)
+# 1단계: 굴절 접미사 (복수형, 시제, 부사형)
+INFLECTIONAL_SUFFIXES = [
+    ('ies', 'y'), ('ably', 'able'), ('ibly', 'ible'), ('ly', ''),
+    ('ing', ''), ('ed', ''), ('s', '')
+]
+# 2단계: 파생 접미사 - 같은 뜻의 대표 형태로 바꾸는 규칙만 둠
+# ('-ion', '-ation', '-able' 등을 지우면 diversion -> divers, carbonation -> carbon 처럼 섞임)
+DERIVATIONAL_SUFFIXES = [
+    ('ability', 'able'), ('ibility', 'ible'), ('mental', 'ment'), ('ity', 'e')
+]
+MIN_STEM_LENGTH = 3  # 'need' -> 'ne' 처럼 너무 짧아지는 것 방지
+
+# 규칙대로 바꾸면 다른 뜻의 키워드와 섞이는 단어는 그대로 둠
+STEM_EXCEPTIONS = {
+    'greens',     # 골프 그린, 채소
+    'greenes',    # 인명 (Greene)
+    'socials',    # SNS 계정 ("follow our socials")
+    # 예전 규칙에서 섞였던 단어들 (규칙을 바꿀 때 다시 섞이지 않도록 유지)
+    'greene', 'diversion', 'carbonation', 'environs', 'sociable'
+}
+
+def strip_suffix(word, rules):
+    """규칙 중 처음 맞는 접미사 하나를 치환 (없으면 그대로 반환)"""
+    for suffix, replacement in rules:
+        if not word.endswith(suffix) or len(word) - len(suffix) < MIN_STEM_LENGTH:
+            continue
+        if suffix == 's' and word.endswith(('ss', 'us', 'is')):  # 'process', 'bonus', 'this' 등은 복수형이 아님
+            continue
+        return word[:-len(suffix)] + replacement
+    return word
+
+def stem_word(word):
+    """간단한 규칙 기반 어간 추출 (굴절 -> 파생 접미사 순으로 각각 최대 한 번)"""
+    if word in STEM_EXCEPTIONS:
+        return word
+    return strip_suffix(strip_suffix(word, INFLECTIONAL_SUFFIXES), DERIVATIONAL_SUFFIXES)
+
+@lru_cache(maxsize=65536)
+def normalize_token(token):
+    """토큰 정규화 (소문자 + 어간 추출, 하이픈 복합어는 부분별로) - 같은 토큰은 한 번만 계산"""
+    token = token.lower()
+    if '-' in token:
+        return '-'.join(normalize_token(part) for part in token.split('-'))
+    return stem_word(token)
+
+def build_group_lookup(keyword_groups):
+    """그룹 변형어를 정규화 형태로 바꿔 {정규화 토큰 튜플: 그룹 집합} 사전 생성"""
+    group_lookup = {}
+    for group_name, word_list in keyword_groups.items():
+        for word in word_list:
+            key = tuple(normalize_token(token) for token in TOKEN_PATTERN.findall(word.lower()))
+            group_lookup.setdefault(key, set()).add(group_name)
+    return group_lookup
+
+def match_keyword_groups(text, group_lookup, max_phrase_length):
+    """텍스트를 한 번만 토큰화해서 모든 그룹을 동시에 매칭
+
+    'global warming' 같은 구(phrase)는 가장 긴 매칭을 우선하고,
+    사전에 없는 하이픈 복합어는 부분 단어로 다시 확인 (예: 'eco-conscious' -> 'eco').
+    반환값: {그룹명: Counter(실제 등장한 형태: 횟수)}
+    """
+    tokens = TOKEN_PATTERN.findall(text.lower())
+    normalized = [normalize_token(token) for token in tokens]
+    matches = {}
+
+    i = 0
+    while i < len(tokens):
+        groups = None
+        length = 1
+        for length in range(min(max_phrase_length, len(tokens) - i), 0, -1):
+            groups = group_lookup.get(tuple(normalized[i:i + length]))
+            if groups:
+                break
+
+        if not groups and '-' in normalized[i]:
+            groups = set()
+            for part in normalized[i].split('-'):
+                groups |= group_lookup.get((part,), set())
+
+        if groups:
+            surface = ' '.join(tokens[i:i + length])
+            for group_name in groups:
+                matches.setdefault(group_name, Counter())[surface] += 1
+        i += length
+
+    return matches
+
+def analyze_video_groups(df, keyword_groups):
+    """각 영상별로 키워드 그룹 출현 분석 -> (영상별 그룹 카운트 DataFrame, 전체 그룹별 변형 Counter)"""
+    group_lookup = build_group_lookup(keyword_groups)
+    max_phrase_length = max(len(key) for key in group_lookup)
+
+    group_rows = []
+    group_details = {group_name: Counter() for group_name in keyword_groups}
+    for description in df['description'].fillna('').astype(str):
+        matches = match_keyword_groups(description, group_lookup, max_phrase_length)
+        group_rows.append({
+            group_name: sum(matches.get(group_name, Counter()).values())
+            for group_name in keyword_groups
+        })
+        for group_name, details in matches.items():
+            group_details[group_name].update(details)
+
+    return pd.DataFrame(group_rows, index=df.index, columns=list(keyword_groups)), group_details
+
+group_analysis, group_details = analyze_video_groups(df, keyword_groups)
 
 print(f"🏷️  키워드 그룹별 출현 빈도:")
 group_results = {}
-for group_name, word_list in keyword_groups.items():
-    total_count, details = count_keyword_group(all_descriptions_lower, word_list)
+for group_name in keyword_groups:
+    total_count = int(group_analysis[group_name].sum())
+    details = dict(group_details[group_name].most_common())
     group_results[group_name] = {'total': total_count, 'details': details}
-    
+
     if total_count > 0:
         print(f"   📂 '{group_name}': {total_count}회")
         for word, count in details.items():
@@ -94,6 +207,7 @@ def analyze_video_keywords(df, keywords):
         video_data = {
             'video_id': row['video_id'],
             'title': row['title'][:50] + '...' if len(str(row['title'])) > 50 else row['title'],
+            'duration_seconds': row.get('duration_seconds', 0),  # 예전 CSV에는 컬럼이 없을 수 있음
             'total_keywords': 0
         }
         
@@ -131,6 +245,11 @@ print(f"📊 전체 통계:")
 print(f"   - 총 영상 수: {total_videos}개")
 print(f"   - 키워드 포함 영상: {videos_with_keywords}개")
 print(f"   - 키워드 포함 비율: {keyword_videos_percentage:.1f}%")
+if 'duration_seconds' in df.columns:
+    has_keywords = video_analysis['total_keywords'] > 0
+    print(f"   - 평균 영상 길이: {video_analysis['duration_seconds'].mean():.0f}초")
+    if has_keywords.any():
+        print(f"   - 키워드 포함 영상 평균 길이: {video_analysis.loc[has_keywords, 'duration_seconds'].mean():.0f}초")
 
 # 가장 자주 사용되는 키워드
 most_common_keywords = []
@@ -153,6 +272,125 @@ for keyword in keywords:
         percentage = (videos_with_keyword / total_videos) * 100
         print(f"   - '{keyword}': {videos_with_keyword}개 영상 ({percentage:.1f}%)")
 
+# 방법 6: 기간별 키워드 트렌드 롤업 (일/주/월)
+print("\n" + "="*50)
+print("🔍 방법 6: 기간별 키워드 트렌드 롤업")
+print("="*50)
+
+# 롤업은 영상 단위로 한 번만 더해지므로, 이미 집계한 video_id를 따로 기록해 증분 업데이트
+ROLLUP_FILENAME = 'nike_keyword_rollups.csv'
+ROLLUP_SEEN_FILENAME = 'nike_keyword_rollups_videos.csv'
+ROLLUP_META_FILENAME = 'nike_keyword_rollups_meta.json'
+ROLLUP_GRANULARITIES = {'day': 'D', 'week': 'W-SUN', 'month': 'M'}
+ROLLUP_KEYS = ['granularity', 'period_start', 'kind', 'name']
+ROLLUP_VALUES = ['mentions', 'videos', 'total_videos']
+
+def build_period_rollups(published_at, counts):
+    """영상별 카운트(counts)를 일/주/월 단위로 집계 (long format)
+
+    counts 컬럼은 'keyword:<이름>' 또는 'group:<이름>' 형식.
+    mentions: 출현 횟수 합계, videos: 한 번 이상 언급한 영상 수, total_videos: 해당 기간 전체 영상 수
+    """
+    published = pd.to_datetime(published_at, utc=True).dt.tz_localize(None)
+    rollup_frames = []
+    for granularity, freq in ROLLUP_GRANULARITIES.items():
+        period_start = published.dt.to_period(freq).dt.start_time.dt.strftime('%Y-%m-%d').rename('period_start')
+        mentions = counts.groupby(period_start).sum().reset_index().melt(
+            id_vars='period_start', var_name='metric', value_name='mentions')
+        videos = (counts > 0).groupby(period_start).sum().reset_index().melt(
+            id_vars='period_start', var_name='metric', value_name='videos')
+        rollup = mentions.merge(videos, on=['period_start', 'metric'])
+        rollup['total_videos'] = rollup['period_start'].map(counts.groupby(period_start).size())
+        rollup[['kind', 'name']] = rollup['metric'].str.split(':', n=1, expand=True)
+        rollup['granularity'] = granularity
+        rollup_frames.append(rollup[ROLLUP_KEYS + ROLLUP_VALUES])
+    return pd.concat(rollup_frames, ignore_index=True)
+
+def build_rollup_meta(keywords, keyword_groups):
+    """롤업을 만든 카운트 규칙 (키워드 목록, 그룹 정의, 매칭 규칙 버전)"""
+    return {
+        'matcher_version': GROUP_MATCHER_VERSION,
+        'keywords': list(keywords),
+        'keyword_groups': {group_name: list(word_list) for group_name, word_list in keyword_groups.items()}
+    }
+
+def load_rollup_meta(meta_filename):
+    """저장된 롤업 규칙 읽기 (없거나 깨졌으면 None)"""
+    try:
+        with open(meta_filename, encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def update_rollups(df, counts, rollup_meta, rollup_filename=ROLLUP_FILENAME,
+                   seen_filename=ROLLUP_SEEN_FILENAME, meta_filename=ROLLUP_META_FILENAME):
+    """아직 집계되지 않은 영상만 기존 롤업에 더해서 저장 (증분 업데이트)
+
+    저장된 롤업의 카운트 규칙(rollup_meta)이 현재와 다르면 예전 값과 섞이지 않도록
+    현재 CSV의 영상들로 처음부터 다시 만든다.
+    반환값: (롤업 DataFrame 또는 None, 새로 반영한 영상 수, 재생성 여부)
+    """
+    rollups = None
+    seen_ids = set()
+    has_saved_rollups = os.path.exists(rollup_filename) and os.path.exists(seen_filename)
+    rebuilt = has_saved_rollups and load_rollup_meta(meta_filename) != rollup_meta
+    if has_saved_rollups and not rebuilt:
+        rollups = pd.read_csv(rollup_filename, dtype={'period_start': str})
+        seen_ids = set(pd.read_csv(seen_filename)['video_id'].astype(str))
+
+    # 같은 CSV 안에 중복된 영상은 한 번만 반영
+    video_ids = df['video_id'].astype(str)
+    is_new = ~video_ids.isin(seen_ids) & ~video_ids.duplicated()
+    if not is_new.any():
+        return rollups, 0, rebuilt
+
+    new_rollups = build_period_rollups(df.loc[is_new, 'published_at'], counts[is_new])
+    if rollups is not None:
+        # 모든 값이 합계이므로 같은 기간/키워드끼리 더하기만 하면 됨
+        new_rollups = (pd.concat([rollups, new_rollups], ignore_index=True)
+                       .groupby(ROLLUP_KEYS, as_index=False)[ROLLUP_VALUES].sum())
+
+    new_rollups.to_csv(rollup_filename, index=False, encoding='utf-8-sig')
+    seen_ids.update(video_ids[is_new])
+    pd.DataFrame({'video_id': sorted(seen_ids)}).to_csv(seen_filename, index=False, encoding='utf-8-sig')
+    with open(meta_filename, 'w', encoding='utf-8') as f:
+        json.dump(rollup_meta, f, ensure_ascii=False, indent=2)
+    return new_rollups, int(is_new.sum()), rebuilt
+
+def query_trend(rollups, name, kind='group', freq='QS', since=None):
+    """월 단위 롤업을 원하는 주기(기본: 분기)로 다시 묶어 트렌드 조회 (설명 원문 재스캔 없음)"""
+    monthly = rollups[(rollups['granularity'] == 'month') &
+                      (rollups['kind'] == kind) &
+                      (rollups['name'] == name)]
+    monthly = monthly.set_index(pd.to_datetime(monthly['period_start']))[ROLLUP_VALUES]
+    if since:
+        monthly = monthly[monthly.index >= pd.Timestamp(since)]
+
+    trend = monthly.resample(freq).sum()
+    trend = trend[trend['total_videos'] > 0]
+    return trend.assign(coverage=(trend['videos'] / trend['total_videos']) * 100)
+
+# 영상별 키워드/그룹 카운트를 하나의 표로 합쳐 롤업 갱신
+rollup_counts = pd.concat([
+    video_analysis[keywords].add_prefix('keyword:'),
+    group_analysis.add_prefix('group:')
+], axis=1)
+rollups, new_video_count, rollups_rebuilt = update_rollups(
+    df, rollup_counts, build_rollup_meta(keywords, keyword_groups))
+
+if rollups_rebuilt:
+    print(f"♻️  키워드/그룹 정의 또는 매칭 규칙이 바뀌어 롤업을 처음부터 다시 만들었습니다.")
+print(f"🗂️  롤업 업데이트: 새 영상 {new_video_count}개 반영")
+if rollups is not None:
+    print(f"   - 저장 파일: {ROLLUP_FILENAME} ({len(rollups)}행)")
+
+    # 예시: 2020년 이후 분기별 'sustainability' 그룹 언급 추이
+    sustainability_trend = query_trend(rollups, 'sustainability', since='2020-01-01')
+    print(f"\n📅 'sustainability' 분기별 추이 (2020년~):")
+    for period, row in sustainability_trend.iterrows():
+        print(f"   - {period.year} Q{period.quarter}: {int(row['mentions'])}회 "
+              f"({int(row['videos'])}/{int(row['total_videos'])}개 영상, {row['coverage']:.1f}%)")
+
 # 선택적으로 상세 결과를 CSV로 저장
 save_detailed_results = input("\n💾 상세 결과를 CSV로 저장하시겠습니까? (y/n): ").lower().strip()
 
@@ -185,10 +423,11 @@ print(f"\n🎉 키워드 분석 완료!")
 개선된 점들:
 1. ✅ 모든 텍스트를 소문자로 변환하여 대소문자 구분 제거
 2. ✅ 정규표현식으로 정확한 단어 매칭 (부분 문자열 방지)
-3. ✅ 복수형/변형 키워드도 함께 고려
+3. ✅ 복수형/변형 키워드도 함께 고려 (정규화된 형태로 한 번에 매칭)
 4. ✅ 영상별 키워드 분석
 5. ✅ 전체 통계 및 인사이트 제공
 6. ✅ 결과를 CSV로 저장 가능
+7. ✅ 일/주/월 단위 트렌드 롤업을 증분 저장 (분기 등 재집계 가능)
 
 사용 방법:
 1. 위 코드를 keyword_analysis.py로 저장